@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from threading import Thread
@@ -88,7 +89,8 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
             List[TextContent]: A list of TextContent objects representing the response(s) from the LLM.
         """
         try:
-            results = self.generator(prompt, **settings.prepare_settings_dict())
+            # the pipeline runs the model synchronously, run it in a worker thread to keep the event loop free
+            results = await asyncio.to_thread(self.generator, prompt, **settings.prepare_settings_dict())
         except Exception as e:
             raise ServiceResponseException("Hugging Face completion failed", e) from e
         if isinstance(results, list):
@@ -2,6 +2,7 @@
 
 import logging
 from collections.abc import Mapping
+from typing import Any
 
 from openai import AsyncOpenAI
 from pydantic import ValidationError
@@ -70,14 +71,19 @@ class OpenAIChatCompletion(OpenAIConfigBase, OpenAIChatCompletionBase, OpenAITex
         )
 
     @classmethod
-    def from_dict(cls, settings: dict[str, str]) -> "OpenAIChatCompletion":
+    def from_dict(cls, settings: dict[str, Any]) -> "OpenAIChatCompletion":
         """Initialize an Open AI service from a dictionary of settings.
 
         Args:
             settings: A dictionary of settings for the service.
+                should contain keys: ai_model_id, and optionally:
+                    service_id, api_key, org_id, default_headers, async_client
         """
         return OpenAIChatCompletion(
             ai_model_id=settings["ai_model_id"],
             service_id=settings.get("service_id"),
+            api_key=settings.get("api_key"),
+            org_id=settings.get("org_id"),
             default_headers=settings.get("default_headers"),
+            async_client=settings.get("async_client"),
         )
@@ -5,6 +5,7 @@ import logging
 from collections.abc import AsyncGenerator
 from copy import copy
 from functools import reduce
+from operator import add
 from typing import TYPE_CHECKING, Any
 
 from openai import AsyncStream
@@ -220,7 +221,7 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
 
             # there is one response stream in the messages, combining now to create the full completion
             # depending on the prompt, the message may contain both function call content and others
-            full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_messages)
+            full_completion: StreamingChatMessageContent = reduce(add, all_messages)
             function_calls = [item for item in full_completion.items if isinstance(item, FunctionCallContent)]
             chat_history.add_message(message=full_completion)
 
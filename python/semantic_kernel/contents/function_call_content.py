@@ -2,7 +2,7 @@
 
 import json
 import logging
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar
 from xml.etree.ElementTree import Element  # nosec
 
@@ -22,6 +22,15 @@ logger = logging.getLogger(__name__)
 _T = TypeVar("_T", bound="FunctionCallContent")
 
 
+@lru_cache(maxsize=128)
+def _split_name(name: str) -> tuple[str, str]:
+    """Split a function call name into a plugin and function name."""
+    index = name.find("-")
+    if index < 0:
+        return "", name
+    return name[:index], name[index + 1 :]
+
+
 class FunctionCallContent(KernelContent):
     """Class to hold a function call response."""
 
@@ -83,14 +92,12 @@ class FunctionCallContent(KernelContent):
         """Split the name into a plugin and function name."""
         if not self.name:
             raise FunctionCallInvalidNameException("Name is not set.")
-        if "-" not in self.name:
-            return ["", self.name]
-        return self.name.split("-", maxsplit=1)
+        return list(_split_name(self.name))
 
     def split_name_dict(self) -> dict:
         """Split the name into a plugin and function name."""
-        parts = self.split_name()
-        return {"plugin_name": parts[0], "function_name": parts[1]}
+        plugin_name, function_name = self.split_name()
+        return {"plugin_name": plugin_name, "function_name": function_name}
 
     def to_element(self) -> Element:
         """Convert the function call to an Element."""
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 import pytest
 
 if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
     from semantic_kernel.contents.chat_history import ChatHistory
     from semantic_kernel.filters.functions.function_invocation_context import FunctionInvocationContext
     from semantic_kernel.functions.kernel_function import KernelFunction
@@ -141,6 +143,16 @@ def chat_history() -> "ChatHistory":
     return ChatHistory()
 
 
+@pytest.fixture(scope="session")
+def mock_async_openai_client() -> "AsyncOpenAI":
+    """An AsyncOpenAI client that never reaches the network, shared by the tests that mock the calls anyway."""
+    import httpx
+    from openai import AsyncOpenAI
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    return AsyncOpenAI(api_key="test_api_key", http_client=httpx.AsyncClient(transport=transport))
+
+
 @pytest.fixture(autouse=True)
 def enable_debug_mode():
     """Set `autouse=True` to enable easy debugging for tests.
@@ -221,6 +233,15 @@ def azure_openai_unit_test_env(monkeypatch, exclude_list, override_env_param_dic
     return env_vars
 
 
+OPENAI_UNIT_TEST_ENV_VARS = {
+    "OPENAI_API_KEY": "test_api_key",
+    "OPENAI_ORG_ID": "test_org_id",
+    "OPENAI_CHAT_MODEL_ID": "test_chat_model_id",
+    "OPENAI_TEXT_MODEL_ID": "test_text_model_id",
+    "OPENAI_EMBEDDING_MODEL_ID": "test_embedding_model_id",
+}
+
+
 @pytest.fixture()
 def openai_unit_test_env(monkeypatch, exclude_list, override_env_param_dict):
     """Fixture to set environment variables for OpenAISettings."""
@@ -230,13 +251,7 @@ def openai_unit_test_env(monkeypatch, exclude_list, override_env_param_dict):
     if override_env_param_dict is None:
         override_env_param_dict = {}
 
-    env_vars = {
-        "OPENAI_API_KEY": "test_api_key",
-        "OPENAI_ORG_ID": "test_org_id",
-        "OPENAI_CHAT_MODEL_ID": "test_chat_model_id",
-        "OPENAI_TEXT_MODEL_ID": "test_text_model_id",
-        "OPENAI_EMBEDDING_MODEL_ID": "test_embedding_model_id",
-    }
+    env_vars = dict(OPENAI_UNIT_TEST_ENV_VARS)
 
     env_vars.update(override_env_param_dict)
 
@@ -249,6 +264,16 @@ def openai_unit_test_env(monkeypatch, exclude_list, override_env_param_dict):
     return env_vars
 
 
+@pytest.fixture(scope="module")
+def module_openai_unit_test_env():
+    """Module scoped version of openai_unit_test_env, for services that are created once per module."""
+    env_vars = dict(OPENAI_UNIT_TEST_ENV_VARS)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for key, value in env_vars.items():
+            monkeypatch.setenv(key, value)
+        yield env_vars
+
+
 @pytest.fixture()
 def google_palm_unit_test_env(monkeypatch, exclude_list, override_env_param_dict):
     """Fixture to set environment variables for Google Palm."""
@@ -1,14 +1,173 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import AsyncIterator, Awaitable, Callable
+from pathlib import Path
+from typing import Any
 
 import pytest
+from openai import AsyncOpenAI, AsyncStream
+from openai.resources.chat.completions import AsyncCompletions as AsyncChatCompletions
+from openai.resources.completions import AsyncCompletions as AsyncTextCompletions
+from openai.types import Completion
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from pydantic import BaseModel
+from pytest_asyncio import is_async_test
 
 import semantic_kernel.connectors.ai.google_palm as sk_gp
+from semantic_kernel.connectors.ai.open_ai.settings.open_ai_settings import OpenAISettings
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.kernel import Kernel
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
 
 
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line(
+        "markers",
+        "duplicate_input: the case sends the same input as a case for another service, "
+        "deselect with '-m \"not duplicate_input\"' for a quick run",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    """Run the completion tests in one event loop and group the parametrized tests by service.
+
+    Sharing the session event loop lets the session-scoped clients keep their
+    connections open between tests, instead of binding their pool to a loop that is
+    closed after the first test.
+
+    When running with `pytest -n auto --dist loadgroup`, all cases for the same
+    service run on the same worker, so the different providers are called in parallel
+    while the requests to a single provider stay sequential.
+    """
+    session_loop = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if item.path.parent != Path(__file__).parent:
+            continue
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        callspec = getattr(item, "callspec", None)
+        if callspec and "service" in callspec.params:
+            item.add_marker(pytest.mark.xdist_group(name=callspec.params["service"]))
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Use uvloop for the completion tests when it is installed, it is not available on Windows."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def shared_async_openai_client() -> AsyncOpenAI:
+    """An OpenAI client built once from the environment and shared by the tests that provide their own client."""
+    openai_settings = OpenAISettings.create()
+    return AsyncOpenAI(
+        api_key=openai_settings.api_key.get_secret_value(),
+        organization=openai_settings.org_id,
+    )
+
+
+RESPONSE_CACHE_ENV = "SK_TEST_CACHE"
+RESPONSE_CACHE_DIR = Path(__file__).parents[2] / ".cache"
+# the credentials are left out of the cache key, so rotating a key keeps the recorded responses
+CACHE_KEY_EXCLUDED_HEADERS = {"authorization", "api-key"}
+
+
+class CachedAsyncStream(AsyncStream):
+    """An AsyncStream that replays previously recorded chunks."""
+
+    def __init__(self, chunks: list[BaseModel]) -> None:
+        self._iterator = self._replay(chunks)
+
+    @staticmethod
+    async def _replay(chunks: list[BaseModel]) -> AsyncIterator[BaseModel]:
+        for chunk in chunks:
+            yield chunk
+
+    async def close(self) -> None:
+        pass
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write the file through a temporary file, so parallel workers never read a partial file."""
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, delete=False) as tmp_file:
+        tmp_file.write(text)
+    os.replace(tmp_file.name, path)
+
+
+def _cached_create(
+    create: Callable[..., Awaitable[Any]],
+    response_type: type[BaseModel],
+    chunk_type: type[BaseModel],
+) -> Callable[..., Awaitable[Any]]:
+    """Wrap an OpenAI `create` method with a disk cache keyed on the request."""
+
+    async def wrapper(self, **kwargs: Any) -> Any:
+        # the endpoint and headers tell apart the services and clients that send the same request
+        headers = {
+            name: value
+            for name, value in self._client.default_headers.items()
+            # unset headers are Omit sentinels, which are not part of the request
+            if isinstance(value, str) and name.lower() not in CACHE_KEY_EXCLUDED_HEADERS
+        }
+        payload = {"base_url": str(self._client.base_url), "headers": headers, "request": kwargs}
+        key = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+        cache_file = RESPONSE_CACHE_DIR / f"{key}.json"
+        stream = kwargs.get("stream", False)
+        if cache_file.exists():
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            if stream:
+                return CachedAsyncStream([chunk_type.model_validate(chunk) for chunk in cached])
+            return response_type.model_validate(cached)
+
+        response = await create(self, **kwargs)
+        if stream:
+            chunks = [chunk async for chunk in response]
+            content = [chunk.model_dump(mode="json") for chunk in chunks]
+            response = CachedAsyncStream(chunks)
+        else:
+            content = response.model_dump(mode="json")
+        RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # keep the recorded responses out of source control, the same way .pytest_cache does
+        _write_atomic(RESPONSE_CACHE_DIR / ".gitignore", "*\n")
+        _write_atomic(cache_file, json.dumps(content))
+        return response
+
+    return wrapper
+
+
+@pytest.fixture(scope="session", autouse=True)
+def response_cache():
+    """Replay OpenAI and Azure OpenAI responses from disk when SK_TEST_CACHE=1.
+
+    Responses are stored under tests/.cache, keyed on the SHA256 of the full request,
+    so only identical requests (endpoint, headers, model, messages and settings) are replayed.
+    """
+    if os.getenv(RESPONSE_CACHE_ENV) != "1":
+        yield
+        return
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            AsyncChatCompletions,
+            "create",
+            _cached_create(AsyncChatCompletions.create, ChatCompletion, ChatCompletionChunk),
+        )
+        mp.setattr(
+            AsyncTextCompletions,
+            "create",
+            _cached_create(AsyncTextCompletions.create, Completion, Completion),
+        )
+        yield
+
+
 @pytest.fixture(scope="function")
 def setup_tldr_function_for_oai_models(kernel: Kernel):
     # Define semantic function using SK prompt template language
@@ -1,7 +1,8 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import os
-from functools import partial, reduce
+from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 import pytest
@@ -24,6 +25,7 @@ from semantic_kernel.contents.function_result_content import FunctionResultConte
 from semantic_kernel.contents.image_content import ImageContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
 from semantic_kernel.core_plugins.math_plugin import MathPlugin
+from semantic_kernel.functions.kernel_plugin import KernelPlugin
 from tests.integration.completions.test_utils import retry
 
 
@@ -32,24 +34,65 @@ def setup(
     service: str,
     execution_settings_kwargs: dict[str, Any],
     services: dict[str, tuple[ChatCompletionClientBase, type[PromptExecutionSettings]]],
+    math_plugin: KernelPlugin,
 ):
     kernel.add_service(services[service][0])
-    kernel.add_plugin(MathPlugin(), plugin_name="math")
+    kernel.add_plugin(math_plugin)
     kernel.add_function(
         function_name="chat",
         plugin_name="chat",
-        prompt="If someone asks how you are, always include the word 'well', "
-        "if you get a direct question, answer the question. {{$chat_history}}",
+        prompt="<message role=\"system\">If someone asks how you are, always include the word 'well', "
+        "if you get a direct question, answer the question.</message>{{$chat_history}}",
         prompt_execution_settings=services[service][1](**execution_settings_kwargs),
     )
 
 
+@cache
+def image_uri_message() -> ChatMessageContent:
+    """Create the image uri message once, it is shared between the cases.
+
+    The image is passed by uri on purpose, the service downloads it, so it is not fetched here.
+    """
+    return ChatMessageContent(
+        role=AuthorRole.USER,
+        items=[
+            TextContent(text="What is in this image?"),
+            ImageContent(
+                uri="https://upload.wikimedia.org/wikipedia/commons/d/d5/Half-timbered_mansion%2C_Zirkel%2C_East_view.jpg"
+            ),
+        ],
+    )
+
+
+@cache
+def image_file_message() -> ChatMessageContent:
+    """Create the image file message on first use.
+
+    This keeps reading and encoding the image out of test collection and shares it between the cases.
+    """
+    return ChatMessageContent(
+        role=AuthorRole.USER,
+        items=[
+            TextContent(text="What is in this image?"),
+            ImageContent.from_image_path(
+                image_path=os.path.join(os.path.dirname(__file__), "../../", "assets/sample_image.jpg")
+            ),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def math_plugin() -> KernelPlugin:
+    # the plugin functions are stateless, so the parsed plugin is shared by the kernel of every test
+    return KernelPlugin.from_object(plugin_name="math", plugin_instance=MathPlugin())
+
+
 @pytest.fixture(scope="function")
 def history() -> ChatHistory:
     return ChatHistory()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def services() -> dict[str, tuple[ChatCompletionClientBase, type[PromptExecutionSettings]]]:
     azure_openai_settings = AzureOpenAISettings.create()
     endpoint = azure_openai_settings.endpoint
@@ -89,15 +132,7 @@ pytestmark = pytest.mark.parametrize(
             "openai",
             {},
             [
-                ChatMessageContent(
-                    role=AuthorRole.USER,
-                    items=[
-                        TextContent(text="What is in this image?"),
-                        ImageContent(
-                            uri="https://upload.wikimedia.org/wikipedia/commons/d/d5/Half-timbered_mansion%2C_Zirkel%2C_East_view.jpg"
-                        ),
-                    ],
-                ),
+                image_uri_message,
                 ChatMessageContent(role=AuthorRole.USER, items=[TextContent(text="Where was it made?")]),
             ],
             ["house", "germany"],
@@ -107,15 +142,7 @@ pytestmark = pytest.mark.parametrize(
             "openai",
             {},
             [
-                ChatMessageContent(
-                    role=AuthorRole.USER,
-                    items=[
-                        TextContent(text="What is in this image?"),
-                        ImageContent.from_image_path(
-                            image_path=os.path.join(os.path.dirname(__file__), "../../", "assets/sample_image.jpg")
-                        ),
-                    ],
-                ),
+                image_file_message,
                 ChatMessageContent(role=AuthorRole.USER, items=[TextContent(text="Where was it made?")]),
             ],
             ["house", "germany"],
@@ -187,37 +214,23 @@ pytestmark = pytest.mark.parametrize(
             "azure",
             {},
             [
-                ChatMessageContent(
-                    role=AuthorRole.USER,
-                    items=[
-                        TextContent(text="What is in this image?"),
-                        ImageContent(
-                            uri="https://upload.wikimedia.org/wikipedia/commons/d/d5/Half-timbered_mansion%2C_Zirkel%2C_East_view.jpg"
-                        ),
-                    ],
-                ),
+                image_uri_message,
                 ChatMessageContent(role=AuthorRole.USER, items=[TextContent(text="Where was it made?")]),
             ],
             ["house", "germany"],
             id="azure_image_input_uri",
+            marks=pytest.mark.duplicate_input,
         ),
         pytest.param(
             "azure",
             {},
             [
-                ChatMessageContent(
-                    role=AuthorRole.USER,
-                    items=[
-                        TextContent(text="What is in this image?"),
-                        ImageContent.from_image_path(
-                            image_path=os.path.join(os.path.dirname(__file__), "../../", "assets/sample_image.jpg")
-                        ),
-                    ],
-                ),
+                image_file_message,
                 ChatMessageContent(role=AuthorRole.USER, items=[TextContent(text="Where was it made?")]),
             ],
             ["house", "germany"],
             id="azure_image_input_file",
+            marks=pytest.mark.duplicate_input,
         ),
         pytest.param(
             "azure",
@@ -290,22 +303,26 @@ async def test_chat_completion(
     kernel: Kernel,
     service: str,
     execution_settings_kwargs: dict[str, Any],
-    inputs: list[ChatMessageContent | list[ChatMessageContent]],
+    inputs: list[ChatMessageContent | list[ChatMessageContent] | Callable[[], ChatMessageContent]],
     outputs: list[str],
     services: dict[str, tuple[ChatCompletionClientBase, type[PromptExecutionSettings]]],
+    math_plugin: KernelPlugin,
     history: ChatHistory,
 ):
-    setup(kernel, service, execution_settings_kwargs, services)
+    setup(kernel, service, execution_settings_kwargs, services, math_plugin)
     for message, output in zip(inputs, outputs):
+        if callable(message):
+            message = message()
         if isinstance(message, list):
             for msg in message:
                 history.add_message(msg)
         else:
             history.add_message(message)
 
-        cmc = await retry(
-            partial(execute_invoke, kernel=kernel, history=history, output=output, stream=False), retries=5
-        )
+        async def invoke() -> ChatMessageContent:
+            return await execute_invoke(kernel=kernel, history=history, output=output, stream=False)
+
+        cmc = await retry(invoke, retries=5)
         history.add_message(cmc)
 
 
@@ -314,31 +331,37 @@ async def test_streaming_chat_completion(
     kernel: Kernel,
     service: str,
     execution_settings_kwargs: dict[str, Any],
-    inputs: list[ChatMessageContent | list[ChatMessageContent]],
+    inputs: list[ChatMessageContent | list[ChatMessageContent] | Callable[[], ChatMessageContent]],
     outputs: list[str],
     services: dict[str, tuple[ChatCompletionClientBase, type[PromptExecutionSettings]]],
+    math_plugin: KernelPlugin,
     history: ChatHistory,
 ):
-    setup(kernel, service, execution_settings_kwargs, services)
+    setup(kernel, service, execution_settings_kwargs, services, math_plugin)
     for message, output in zip(inputs, outputs):
+        if callable(message):
+            message = message()
         if isinstance(message, list):
             for msg in message:
                 history.add_message(msg)
         else:
             history.add_message(message)
-        cmc = await retry(
-            partial(execute_invoke, kernel=kernel, history=history, output=output, stream=True), retries=5
-        )
+
+        async def invoke() -> ChatMessageContent:
+            return await execute_invoke(kernel=kernel, history=history, output=output, stream=True)
+
+        cmc = await retry(invoke, retries=5)
         history.add_message(cmc)
 
 
 async def execute_invoke(kernel: Kernel, history: ChatHistory, output: str, stream: bool) -> "ChatMessageContent":
     if stream:
         invocation = kernel.invoke_stream(function_name="chat", plugin_name="chat", chat_history=history)
-        parts = [part[0] async for part in invocation]
-        if parts:
-            response = reduce(lambda p, r: p + r, parts)
-        else:
+        response = None
+        async for part in invocation:
+            # StreamingChatMessageContent.__add__ merges into the left operand, so this stays a single pass
+            response = part[0] if response is None else response + part[0]
+        if response is None:
             raise AssertionError("No response")
     else:
         invocation = await kernel.invoke(function_name="chat", plugin_name="chat", chat_history=history)
@@ -69,9 +69,9 @@ async def test_text_completion(model_name, task, input_str):
     except AssertionError:
         pytest.xfail("The output is empty, but completed invoke")
 
-    stream_summary = ""
+    stream_chunks: list[str] = []
     async for text in kernel.invoke_stream(function_name="TestFunction", plugin_name="TestPlugin", arguments=arguments):
-        stream_summary += str(text[0])
+        stream_chunks.append(str(text[0]))
 
-    stream_output = str(stream_summary).strip()
+    stream_output = "".join(stream_chunks).strip()
     assert len(stream_output) > 0
@@ -5,28 +5,20 @@ import pytest
 from openai import AsyncOpenAI
 
 import semantic_kernel.connectors.ai.open_ai as sk_oai
-from semantic_kernel.connectors.ai.open_ai.settings.open_ai_settings import OpenAISettings
 from semantic_kernel.contents.chat_history import ChatHistory
 
 
 @pytest.mark.asyncio
-async def test_oai_chat_service_with_yaml_jinja2(setup_tldr_function_for_oai_models):
+async def test_oai_chat_service_with_yaml_jinja2(
+    setup_tldr_function_for_oai_models, shared_async_openai_client: AsyncOpenAI
+):
     kernel, _, _ = setup_tldr_function_for_oai_models
 
-    openai_settings = OpenAISettings.create()
-    api_key = openai_settings.api_key.get_secret_value()
-    org_id = openai_settings.org_id
-
-    client = AsyncOpenAI(
-        api_key=api_key,
-        organization=org_id,
-    )
-
     kernel.add_service(
         sk_oai.OpenAIChatCompletion(
             service_id="chat-gpt",
             ai_model_id="gpt-3.5-turbo",
-            async_client=client,
+            async_client=shared_async_openai_client,
         ),
         overwrite=True,  # Overwrite the service if it already exists since add service says it does
     )
@@ -47,23 +39,16 @@ async def test_oai_chat_service_with_yaml_jinja2(setup_tldr_function_for_oai_mod
 
 
 @pytest.mark.asyncio
-async def test_oai_chat_service_with_yaml_handlebars(setup_tldr_function_for_oai_models):
+async def test_oai_chat_service_with_yaml_handlebars(
+    setup_tldr_function_for_oai_models, shared_async_openai_client: AsyncOpenAI
+):
     kernel, _, _ = setup_tldr_function_for_oai_models
 
-    openai_settings = OpenAISettings.create()
-    api_key = openai_settings.api_key.get_secret_value()
-    org_id = openai_settings.org_id
-
-    client = AsyncOpenAI(
-        api_key=api_key,
-        organization=org_id,
-    )
-
     kernel.add_service(
         sk_oai.OpenAIChatCompletion(
             service_id="chat-gpt",
             ai_model_id="gpt-3.5-turbo",
-            async_client=client,
+            async_client=shared_async_openai_client,
         ),
         overwrite=True,  # Overwrite the service if it already exists since add service says it does
     )
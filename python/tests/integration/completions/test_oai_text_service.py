@@ -5,7 +5,6 @@ from openai import AsyncOpenAI
 from test_utils import retry
 
 import semantic_kernel.connectors.ai.open_ai as sk_oai
-from semantic_kernel.connectors.ai.open_ai.settings.open_ai_settings import OpenAISettings
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
@@ -42,23 +41,16 @@ async def test_oai_text_completion_with_plugins(setup_tldr_function_for_oai_mode
 
 
 @pytest.mark.asyncio
-async def test_oai_text_completion_with_plugins_with_provided_client(setup_tldr_function_for_oai_models):
+async def test_oai_text_completion_with_plugins_with_provided_client(
+    setup_tldr_function_for_oai_models, shared_async_openai_client: AsyncOpenAI
+):
     kernel, prompt, text_to_summarize = setup_tldr_function_for_oai_models
 
-    openai_settings = OpenAISettings.create()
-    api_key = openai_settings.api_key.get_secret_value()
-    org_id = openai_settings.org_id
-
-    client = AsyncOpenAI(
-        api_key=api_key,
-        organization=org_id,
-    )
-
     kernel.add_service(
         sk_oai.OpenAITextCompletion(
             service_id="text-completion",
             ai_model_id="gpt-3.5-turbo-instruct",
-            async_client=client,
+            async_client=shared_async_openai_client,
         ),
         overwrite=True,
     )
@@ -116,10 +108,10 @@ async def test_azure_oai_text_stream_completion_with_plugins(setup_tldr_function
 
     arguments = KernelArguments(input=text_to_summarize)
 
-    result = None
+    chunks: list[str] = []
     async for message in kernel.invoke_stream(tldr_function, arguments):
-        result = message[0] if not result else result + message[0]
-    output = str(result)
+        chunks.append(str(message[0]))
+    output = "".join(chunks)
 
     print(f"TLDR using input string: '{output}'")
     # assert "First Law" not in output and ("human" in output or "Human" in output or "preserve" in output)
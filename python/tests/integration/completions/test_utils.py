@@ -2,12 +2,31 @@
 
 import asyncio
 import logging
+import random
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from openai import APIStatusError
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger()
 
+T = TypeVar("T")
+
+
+def get_retry_after(exception: BaseException | None) -> float | None:
+    """Get the retry-after header (in seconds) of an OpenAI error, also when it is wrapped by SK."""
+    while exception is not None:
+        if isinstance(exception, APIStatusError):
+            try:
+                return float(exception.response.headers.get("retry-after", ""))
+            except ValueError:
+                return None
+        exception = exception.__cause__
+    return None
+
 
-async def retry(func, retries=20):
+async def retry(func: Callable[[], Awaitable[T]], retries: int = 20) -> T | None:
     min_delay = 2
     max_delay = 7
     for i in range(retries):
@@ -17,5 +36,9 @@ async def retry(func, retries=20):
             logger.error(f"Retry {i + 1}: {e}")
             if i == retries - 1:  # Last retry
                 raise
-            await asyncio.sleep(max(min(i, max_delay), min_delay))
+            delay = get_retry_after(e)
+            if delay is None:
+                # exponential backoff with jitter, so parallel workers do not retry in lockstep
+                delay = random.uniform(min_delay, min(max_delay, min_delay * 2**i))  # nosec
+            await asyncio.sleep(delay)
     return None
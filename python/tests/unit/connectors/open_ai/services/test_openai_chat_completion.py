@@ -1,96 +1,119 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+from functools import partial
 
 import pytest
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
 from semantic_kernel.connectors.ai.open_ai.const import USER_AGENT
+from semantic_kernel.connectors.ai.open_ai.services import open_ai_config_base
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
-from semantic_kernel.exceptions.service_exceptions import ServiceInitializationError
 
+DEFAULT_HEADERS = {"X-Unit-Test": "test-guid"}
 
-def test_open_ai_chat_completion_init(openai_unit_test_env) -> None:
-    # Test successful initialization
-    open_ai_chat_completion = OpenAIChatCompletion()
 
-    assert open_ai_chat_completion.ai_model_id == openai_unit_test_env["OPENAI_CHAT_MODEL_ID"]
-    assert isinstance(open_ai_chat_completion, ChatCompletionClientBase)
+@pytest.fixture(scope="module", autouse=True)
+def shared_httpx_client():
+    """Let every AsyncOpenAI client in this module reuse one httpx client.
 
+    Building the httpx client (and its SSL context) is most of the cost of constructing the service,
+    while these tests never send a request.
+    """
+    http_client = DefaultAsyncHttpxClient()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # the services create their client in open_ai_config_base, pass the shared http client there
+        monkeypatch.setattr(open_ai_config_base, "AsyncOpenAI", partial(AsyncOpenAI, http_client=http_client))
+        yield http_client
+    asyncio.run(http_client.aclose())
 
-def test_open_ai_chat_completion_init_ai_model_id_constructor(openai_unit_test_env) -> None:
-    # Test successful initialization
-    ai_model_id = "test_model_id"
-    open_ai_chat_completion = OpenAIChatCompletion(ai_model_id=ai_model_id)
-
-    assert open_ai_chat_completion.ai_model_id == ai_model_id
-    assert isinstance(open_ai_chat_completion, ChatCompletionClientBase)
 
+@pytest.fixture(scope="module")
+def default_chat_client(module_openai_unit_test_env) -> OpenAIChatCompletion:
+    return OpenAIChatCompletion()
 
-def test_open_ai_chat_completion_init_with_default_header(openai_unit_test_env) -> None:
-    default_headers = {"X-Unit-Test": "test-guid"}
 
-    # Test successful initialization
-    open_ai_chat_completion = OpenAIChatCompletion(
-        default_headers=default_headers,
-    )
+@pytest.fixture(scope="module")
+def chat_client_with_headers(module_openai_unit_test_env) -> OpenAIChatCompletion:
+    return OpenAIChatCompletion(default_headers=DEFAULT_HEADERS)
 
-    assert open_ai_chat_completion.ai_model_id == openai_unit_test_env["OPENAI_CHAT_MODEL_ID"]
-    assert isinstance(open_ai_chat_completion, ChatCompletionClientBase)
 
-    # Assert that the default header we added is present in the client's default headers
-    for key, value in default_headers.items():
-        assert key in open_ai_chat_completion.client.default_headers
-        assert open_ai_chat_completion.client.default_headers[key] == value
+def test_open_ai_chat_completion_is_chat_completion_client() -> None:
+    assert issubclass(OpenAIChatCompletion, ChatCompletionClientBase)
 
 
-@pytest.mark.parametrize("exclude_list", [["OPENAI_API_KEY"]], indirect=True)
-def test_open_ai_chat_completion_init_with_empty_model_id(openai_unit_test_env) -> None:
-    with pytest.raises(ServiceInitializationError):
-        OpenAIChatCompletion()
+def test_open_ai_chat_completion_init(default_chat_client, module_openai_unit_test_env) -> None:
+    # Test successful initialization
+    assert default_chat_client.ai_model_id == module_openai_unit_test_env["OPENAI_CHAT_MODEL_ID"]
 
 
-@pytest.mark.parametrize("exclude_list", [["OPENAI_API_KEY"]], indirect=True)
-def test_open_ai_chat_completion_init_with_empty_api_key(openai_unit_test_env) -> None:
+def test_open_ai_chat_completion_init_ai_model_id_constructor(module_openai_unit_test_env) -> None:
+    # Test successful initialization
     ai_model_id = "test_model_id"
+    open_ai_chat_completion = OpenAIChatCompletion(ai_model_id=ai_model_id)
+
+    assert open_ai_chat_completion.ai_model_id == ai_model_id
 
-    with pytest.raises(ServiceInitializationError):
-        OpenAIChatCompletion(
-            ai_model_id=ai_model_id,
-        )
+
+def test_open_ai_chat_completion_init_with_default_header(
+    chat_client_with_headers, module_openai_unit_test_env
+) -> None:
+    # Test successful initialization
+    assert chat_client_with_headers.ai_model_id == module_openai_unit_test_env["OPENAI_CHAT_MODEL_ID"]
+
+    # Assert that the default header we added is present in the client's default headers
+    for key, value in DEFAULT_HEADERS.items():
+        assert key in chat_client_with_headers.client.default_headers
+        assert chat_client_with_headers.client.default_headers[key] == value
 
 
-def test_open_ai_chat_completion_serialize(openai_unit_test_env) -> None:
-    default_headers = {"X-Unit-Test": "test-guid"}
+@pytest.fixture
+def built_service(request, module_openai_unit_test_env, shared_httpx_client) -> tuple[OpenAIChatCompletion, dict]:
+    """Build the service from_dict with the base settings and the extra settings of the test case.
 
+    The api key and org id differ from the environment, so the test fails when from_dict drops them.
+    When the case injects a client, it is built here, otherwise from_dict builds the client.
+    """
+    extra_settings, inject_client = request.param
     settings = {
-        "ai_model_id": openai_unit_test_env["OPENAI_CHAT_MODEL_ID"],
-        "api_key": openai_unit_test_env["OPENAI_API_KEY"],
-        "default_headers": default_headers,
+        "ai_model_id": module_openai_unit_test_env["OPENAI_CHAT_MODEL_ID"],
+        "api_key": "test_from_dict_api_key",
+        **extra_settings,
     }
-
-    open_ai_chat_completion = OpenAIChatCompletion.from_dict(settings)
+    if inject_client:
+        settings["async_client"] = AsyncOpenAI(
+            http_client=shared_httpx_client,
+            api_key=settings["api_key"],
+            organization=settings.get("org_id"),
+            default_headers={**settings.get("default_headers", {}), USER_AGENT: "semantic-kernel-python"},
+        )
+    return OpenAIChatCompletion.from_dict(settings), settings
+
+
+@pytest.mark.parametrize(
+    "built_service",
+    [
+        ({"default_headers": DEFAULT_HEADERS}, False),
+        ({"org_id": "test_from_dict_org_id"}, False),
+        ({"default_headers": DEFAULT_HEADERS, "org_id": "test_from_dict_org_id"}, True),
+    ],
+    ids=["default_headers", "org_id", "async_client"],
+    indirect=True,
+)
+def test_open_ai_chat_completion_serialize(built_service) -> None:
+    open_ai_chat_completion, settings = built_service
+
+    if "async_client" in settings:
+        assert open_ai_chat_completion.client is settings["async_client"]
     dumped_settings = open_ai_chat_completion.to_dict()
-    assert dumped_settings["ai_model_id"] == openai_unit_test_env["OPENAI_CHAT_MODEL_ID"]
-    assert dumped_settings["api_key"] == openai_unit_test_env["OPENAI_API_KEY"]
+    assert dumped_settings["ai_model_id"] == settings["ai_model_id"]
+    assert dumped_settings["api_key"] == settings["api_key"]
+    if "org_id" in settings:
+        assert dumped_settings["org_id"] == settings["org_id"]
     # Assert that the default header we added is present in the dumped_settings default headers
-    for key, value in default_headers.items():
+    for key, value in settings.get("default_headers", {}).items():
         assert key in dumped_settings["default_headers"]
         assert dumped_settings["default_headers"][key] == value
     # Assert that the 'User-agent' header is not present in the dumped_settings default headers
     assert USER_AGENT not in dumped_settings["default_headers"]
-
-
-def test_open_ai_chat_completion_serialize_with_org_id(openai_unit_test_env) -> None:
-    settings = {
-        "ai_model_id": openai_unit_test_env["OPENAI_CHAT_MODEL_ID"],
-        "api_key": openai_unit_test_env["OPENAI_API_KEY"],
-        "org_id": openai_unit_test_env["OPENAI_ORG_ID"],
-    }
-
-    open_ai_chat_completion = OpenAIChatCompletion.from_dict(settings)
-    dumped_settings = open_ai_chat_completion.to_dict()
-    assert dumped_settings["ai_model_id"] == openai_unit_test_env["OPENAI_CHAT_MODEL_ID"]
-    assert dumped_settings["api_key"] == openai_unit_test_env["OPENAI_API_KEY"]
-    assert dumped_settings["org_id"] == openai_unit_test_env["OPENAI_ORG_ID"]
-    # Assert that the 'User-agent' header is not present in the dumped_settings default headers
-    assert USER_AGENT not in dumped_settings["default_headers"]
@@ -0,0 +1,18 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+
+import pytest
+
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
+from semantic_kernel.exceptions.service_exceptions import ServiceInitializationError
+
+
+@pytest.mark.parametrize(
+    "exclude_list, kwargs",
+    [(["OPENAI_CHAT_MODEL_ID"], {}), (["OPENAI_API_KEY"], {"ai_model_id": "test_model_id"})],
+    ids=["empty_model_id", "empty_api_key"],
+    indirect=["exclude_list"],
+)
+def test_open_ai_chat_completion_init_with_missing_setting(openai_unit_test_env, kwargs) -> None:
+    with pytest.raises(ServiceInitializationError):
+        OpenAIChatCompletion(**kwargs)
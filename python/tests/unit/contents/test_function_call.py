@@ -1,5 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import math
+
 import pytest
 
 from semantic_kernel.contents.function_call_content import FunctionCallContent
@@ -9,10 +11,21 @@ from semantic_kernel.exceptions.content_exceptions import (
 )
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 
+EXPECTED_ARGS_JSON = '{"input": "world"}'
+EXPECTED_ARGS_DICT = {"input": "world"}
+EMPTY_KERNEL_ARGUMENTS = KernelArguments()
+EXPECTED_DUMP = {
+    "content_type": "function_call",
+    "id": "test",
+    "name": "Test-Function",
+    "arguments": EXPECTED_ARGS_JSON,
+    "metadata": {},
+}
+
 
 def test_function_call(function_call: FunctionCallContent):
     assert function_call.name == "Test-Function"
-    assert function_call.arguments == """{"input": "world"}"""
+    assert function_call.arguments == EXPECTED_ARGS_JSON
     assert function_call.function_name == "Function"
     assert function_call.plugin_name == "Test"
 
@@ -22,7 +35,7 @@ def test_add(function_call: FunctionCallContent):
     fc2 = FunctionCallContent(id="test", name="Test-Function", arguments="""{"input2": "world2"}""")
     fc3 = function_call + fc2
     assert fc3.name == "Test-Function"
-    assert fc3.arguments == """{"input": "world"}{"input2": "world2"}"""
+    assert fc3.arguments == EXPECTED_ARGS_JSON + """{"input2": "world2"}"""
 
 
 def test_add_none(function_call: FunctionCallContent):
@@ -30,12 +43,39 @@ def test_add_none(function_call: FunctionCallContent):
     fc2 = None
     fc3 = function_call + fc2
     assert fc3.name == "Test-Function"
-    assert fc3.arguments == """{"input": "world"}"""
+    assert fc3.arguments == EXPECTED_ARGS_JSON
 
 
 def test_parse_arguments(function_call: FunctionCallContent):
     # Test parsing arguments to dictionary
-    assert function_call.parse_arguments() == {"input": "world"}
+    assert function_call.parse_arguments() == EXPECTED_ARGS_DICT
+
+
+def test_parse_arguments_fresh_dict_per_call(function_call: FunctionCallContent):
+    # Test that changing the parsed arguments does not change the next parse
+    parsed = function_call.parse_arguments()
+    parsed["input"] = "changed"
+    assert function_call.parse_arguments() == EXPECTED_ARGS_DICT
+
+
+def test_parse_arguments_fresh_nested_values_per_call():
+    # Test that changing a nested value does not change the arguments of another call
+    arguments = """{"items": [1, 2]}"""
+    FunctionCallContent(id="test", name="Test-Function", arguments=arguments).to_kernel_arguments()["items"].append(3)
+    fc = FunctionCallContent(id="test2", name="Test-Function", arguments=arguments)
+    assert fc.parse_arguments() == {"items": [1, 2]}
+
+
+def test_parse_arguments_non_strict_json():
+    # Test that NaN in the arguments is accepted, as json.loads does
+    fc = FunctionCallContent(id="test", name="Test-Function", arguments="""{"input": NaN}""")
+    assert math.isnan(fc.parse_arguments()["input"])
+
+
+def test_parse_arguments_large_int():
+    # Test that integers wider than 64 bits are parsed exactly
+    fc = FunctionCallContent(id="test", name="Test-Function", arguments="""{"n": 123456789012345678901234567890}""")
+    assert fc.parse_arguments() == {"n": 123456789012345678901234567890}
 
 
 def test_parse_arguments_none():
@@ -62,7 +102,7 @@ def test_to_kernel_arguments(function_call: FunctionCallContent):
 def test_to_kernel_arguments_none():
     # Test parsing arguments to variables
     fc = FunctionCallContent(id="test", name="Test-Function")
-    assert fc.to_kernel_arguments() == KernelArguments()
+    assert fc.to_kernel_arguments() == EMPTY_KERNEL_ARGUMENTS
 
 
 def test_split_name(function_call: FunctionCallContent):
@@ -87,16 +127,20 @@ def test_split_name_none():
         fc.split_name()
 
 
+def test_split_name_after_model_copy(function_call: FunctionCallContent):
+    # Test that a copy with a new name is split by its own name
+    assert function_call.split_name() == ["Test", "Function"]
+    fc = function_call.model_copy(update={"name": "Other-Call"})
+    assert fc.split_name() == ["Other", "Call"]
+    assert fc.split_name_dict() == {"plugin_name": "Other", "function_name": "Call"}
+
+
 def test_fc_dump(function_call: FunctionCallContent):
     # Test dumping the function call to dictionary
     dumped = function_call.model_dump(exclude_none=True)
-    assert dumped == {
-        "content_type": "function_call",
-        "id": "test",
-        "name": "Test-Function",
-        "arguments": '{"input": "world"}',
-        "metadata": {},
-    }
+    for key, value in EXPECTED_DUMP.items():
+        assert dumped[key] == value
+    assert len(dumped) == len(EXPECTED_DUMP)
 
 
 def test_fc_dump_json(function_call: FunctionCallContent):
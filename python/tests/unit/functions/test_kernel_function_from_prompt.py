@@ -148,9 +148,11 @@ def test_init_prompt_execution_settings_dict():
 
 
 @pytest.mark.asyncio
-async def test_invoke_chat_stream(openai_unit_test_env):
+async def test_invoke_chat_stream(openai_unit_test_env, mock_async_openai_client):
     kernel = Kernel()
-    kernel.add_service(OpenAIChatCompletion(service_id="test", ai_model_id="test"))
+    kernel.add_service(
+        OpenAIChatCompletion(service_id="test", ai_model_id="test", async_client=mock_async_openai_client)
+    )
     function = KernelFunctionFromPrompt(
         function_name="test",
         plugin_name="test",
@@ -177,9 +179,11 @@ async def test_invoke_chat_stream(openai_unit_test_env):
 
 
 @pytest.mark.asyncio
-async def test_invoke_exception(openai_unit_test_env):
+async def test_invoke_exception(openai_unit_test_env, mock_async_openai_client):
     kernel = Kernel()
-    kernel.add_service(OpenAIChatCompletion(service_id="test", ai_model_id="test"))
+    kernel.add_service(
+        OpenAIChatCompletion(service_id="test", ai_model_id="test", async_client=mock_async_openai_client)
+    )
     function = KernelFunctionFromPrompt(
         function_name="test",
         plugin_name="test",
@@ -207,9 +211,11 @@ async def test_invoke_exception(openai_unit_test_env):
 
 
 @pytest.mark.asyncio
-async def test_invoke_text(openai_unit_test_env):
+async def test_invoke_text(openai_unit_test_env, mock_async_openai_client):
     kernel = Kernel()
-    kernel.add_service(OpenAITextCompletion(service_id="test", ai_model_id="test"))
+    kernel.add_service(
+        OpenAITextCompletion(service_id="test", ai_model_id="test", async_client=mock_async_openai_client)
+    )
     function = KernelFunctionFromPrompt(
         function_name="test",
         plugin_name="test",
@@ -232,9 +238,11 @@ async def test_invoke_text(openai_unit_test_env):
 
 
 @pytest.mark.asyncio
-async def test_invoke_exception_text(openai_unit_test_env):
+async def test_invoke_exception_text(openai_unit_test_env, mock_async_openai_client):
     kernel = Kernel()
-    kernel.add_service(OpenAITextCompletion(service_id="test", ai_model_id="test"))
+    kernel.add_service(
+        OpenAITextCompletion(service_id="test", ai_model_id="test", async_client=mock_async_openai_client)
+    )
     function = KernelFunctionFromPrompt(
         function_name="test",
         plugin_name="test",
@@ -260,9 +268,11 @@ async def test_invoke_exception_text(openai_unit_test_env):
 
 
 @pytest.mark.asyncio
-async def test_invoke_defaults(openai_unit_test_env):
+async def test_invoke_defaults(openai_unit_test_env, mock_async_openai_client):
     kernel = Kernel()
-    kernel.add_service(OpenAIChatCompletion(service_id="test", ai_model_id="test"))
+    kernel.add_service(
+        OpenAIChatCompletion(service_id="test", ai_model_id="test", async_client=mock_async_openai_client)
+    )
     function = KernelFunctionFromPrompt(
         function_name="test",
         plugin_name="test",
@@ -301,9 +311,11 @@ def test_create_with_multiple_settings():
 
 
 @pytest.mark.asyncio
-async def test_create_with_multiple_settings_one_service_registered(openai_unit_test_env):
+async def test_create_with_multiple_settings_one_service_registered(openai_unit_test_env, mock_async_openai_client):
     kernel = Kernel()
-    kernel.add_service(OpenAIChatCompletion(service_id="test2", ai_model_id="test"))
+    kernel.add_service(
+        OpenAIChatCompletion(service_id="test2", ai_model_id="test", async_client=mock_async_openai_client)
+    )
     function = KernelFunctionFromPrompt(
         function_name="test",
         plugin_name="test",
@@ -357,8 +369,10 @@ def test_from_directory_config_only():
 
 
 @pytest.mark.asyncio
-async def test_prompt_render(kernel: Kernel, openai_unit_test_env):
-    kernel.add_service(OpenAIChatCompletion(service_id="default", ai_model_id="test"))
+async def test_prompt_render(kernel: Kernel, openai_unit_test_env, mock_async_openai_client):
+    kernel.add_service(
+        OpenAIChatCompletion(service_id="default", ai_model_id="test", async_client=mock_async_openai_client)
+    )
     function = KernelFunctionFromPrompt(
         function_name="test",
         plugin_name="test",
@@ -372,8 +386,10 @@ async def test_prompt_render(kernel: Kernel, openai_unit_test_env):
 
 
 @pytest.mark.asyncio
-async def test_prompt_render_with_filter(kernel: Kernel, openai_unit_test_env):
-    kernel.add_service(OpenAIChatCompletion(service_id="default", ai_model_id="test"))
+async def test_prompt_render_with_filter(kernel: Kernel, openai_unit_test_env, mock_async_openai_client):
+    kernel.add_service(
+        OpenAIChatCompletion(service_id="default", ai_model_id="test", async_client=mock_async_openai_client)
+    )
 
     @kernel.filter("prompt_rendering")
     async def prompt_rendering_filter(context: PromptRenderContext, next):